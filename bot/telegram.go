@@ -48,6 +48,7 @@ type TelegramBot struct {
 type StatsProvider interface {
 	GetStats() (trades, wins, losses int, pnl, equity decimal.Decimal)
 	GetBalance() (decimal.Decimal, error)
+	RefreshBalance() (decimal.Decimal, error)
 	GetRecentTrades(limit int) ([]types.TradeRecord, error)
 	GetOpenPositions() ([]types.PositionRecord, error)
 }
@@ -499,7 +500,8 @@ func (b *TelegramBot) cmdBalance() {
 		return
 	}
 
-	balance, err := b.statsProvider.GetBalance()
+	// Explicit request - always ask the exchange, not the status cache
+	balance, err := b.statsProvider.RefreshBalance()
 	if err != nil {
 		b.send("❌ Failed to fetch balance")
 		return
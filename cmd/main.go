@@ -139,6 +139,7 @@ func main() {
 	if err != nil {
 		log.Fatal().Err(err).Msg("Failed to initialize CLOB client")
 	}
+	clobClient.StartKeepAlive()
 
 	// Execution layer with state machine
 	execConfig := execution.DefaultExecutorConfig()
@@ -184,11 +185,22 @@ func main() {
 	persisterAdapter := execution.NewReconcilerAdapter(reconciler)
 	phaseScalper.SetRiskGate(riskAdapter)
 	phaseScalper.SetPersister(persisterAdapter)
+
+	// Trade journal (gzipped JSONL of closed trades, per asset per day)
+	var journal *storage.Journal
+	if dir := os.Getenv("TRADE_JOURNAL_DIR"); dir != "" {
+		if j, err := storage.NewJournal(dir); err != nil {
+			log.Warn().Err(err).Str("dir", dir).Msg("Trade journal unavailable")
+		} else {
+			journal = j
+			phaseScalper.SetJournal(journal)
+		}
+	}
 	// phaseScalper.SetExecutor(executor) // Enable when ready for live execution
 	
-	// In LIVE mode, sync balance from exchange
+	// In LIVE mode, sync balance from exchange (fresh, never a cached value)
 	if !paperMode {
-		realBalance, err := clobClient.GetBalance()
+		realBalance, err := clobClient.RefreshBalance()
 		log.Debug().
 			Err(err).
 			Str("balance", realBalance.StringFixed(2)).
@@ -370,6 +382,7 @@ func main() {
 	// 3. Stop other components
 	log.Info().Msg("Stopping feeds...")
 	engine.Stop()
+	clobClient.Stop()
 	chainlinkFeed.Stop()
 	binanceFeed.Stop()
 	windowScanner.Stop()
@@ -378,6 +391,10 @@ func main() {
 		tgBot.Stop()
 	}
 
+	if journal != nil {
+		journal.Close()
+	}
+
 	if db != nil {
 		db.Close()
 	}
@@ -434,11 +434,16 @@ func (e *Engine) SetTradeNotifier(notifier TradeNotifier) {
 	e.tradeNotifier = notifier
 }
 
-// GetBalance returns current USDC balance from exchange
+// GetBalance returns current USDC balance from exchange (may be cached briefly)
 func (e *Engine) GetBalance() (decimal.Decimal, error) {
 	return e.executor.GetBalance()
 }
 
+// RefreshBalance fetches USDC balance from exchange, bypassing the cache
+func (e *Engine) RefreshBalance() (decimal.Decimal, error) {
+	return e.executor.RefreshBalance()
+}
+
 // GetRecentTrades returns last N trades from database
 func (e *Engine) GetRecentTrades(limit int) ([]types.TradeRecord, error) {
 	if e.db == nil {
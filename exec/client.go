@@ -11,9 +11,13 @@ import (
 	"io"
 	"math/big"
 	"math/rand"
+	"net"
 	"net/http"
+	"net/url"
 	"os"
+	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/ethereum/go-ethereum/common"
@@ -54,6 +58,16 @@ const (
 	// Order sides
 	SideBuy  = "BUY"
 	SideSell = "SELL"
+
+	// Balance lookups are cached this long (one REST + up to 4 RPC calls each)
+	balanceCacheTTL = 30 * time.Second
+
+	// Signed orders are kept for retries this long (one market window)
+	signedOrderTTL = 15 * time.Minute
+
+	// Pagination cursors (base64 offsets used by the CLOB API)
+	cursorStart = "MA==" // First page
+	cursorEnd   = "LTE=" // No more pages
 )
 
 // OrderType for Polymarket CLOB
@@ -77,6 +91,25 @@ type Client struct {
 	sigType       int
 	dryRun        bool
 	httpClient    *http.Client
+
+	// Proactive throttling from X-RateLimit-* response headers
+	rateMu      sync.Mutex
+	nextRequest time.Time     // Earliest slot the next request may take
+	rateSpacing time.Duration // Gap reserved per request while pacing (0 = unpaced)
+	pausedUntil time.Time     // End of the last 429 Retry-After pause
+
+	// Balance cache (see balanceCacheTTL)
+	balanceMu  sync.Mutex
+	balance    decimal.Decimal
+	balanceAt  time.Time
+	balanceGen uint64 // Bumped on invalidation so in-flight fetches don't cache stale funds
+
+	// Idempotency state per caller-supplied client order ID
+	clientOrdersMu sync.Mutex
+	signedOrders   map[string]*clientOrder // Reused on retry until settled or signedOrderTTL passes
+
+	stopCh   chan struct{}
+	stopOnce sync.Once
 }
 
 // NewClient creates a new execution client
@@ -97,7 +130,9 @@ func NewClient() (*Client, error) {
 		funderAddress: os.Getenv("FUNDER_ADDRESS"),
 		sigType:       sigType,
 		dryRun:        dryRun,
-		httpClient:    &http.Client{Timeout: 30 * time.Second},
+		httpClient:    newHTTPClient(),
+		signedOrders:  make(map[string]*clientOrder),
+		stopCh:        make(chan struct{}),
 	}
 
 	// Load private key
@@ -127,6 +162,90 @@ func NewClient() (*Client, error) {
 	return client, nil
 }
 
+// newHTTPClient builds a dedicated transport for CLOB traffic
+// HTTP/2 multiplexes concurrent order, cancel and balance calls over one TLS
+// connection; gzip response decoding is handled by the transport
+func newHTTPClient() *http.Client {
+	transport := &http.Transport{
+		Proxy: http.ProxyFromEnvironment,
+		DialContext: (&net.Dialer{
+			Timeout:   3 * time.Second,
+			KeepAlive: 30 * time.Second,
+		}).DialContext,
+		ForceAttemptHTTP2:     true,
+		MaxIdleConns:          16,
+		MaxIdleConnsPerHost:   4,
+		MaxConnsPerHost:       16,
+		IdleConnTimeout:       90 * time.Second,
+		TLSHandshakeTimeout:   5 * time.Second,
+		ExpectContinueTimeout: 1 * time.Second,
+	}
+
+	return &http.Client{
+		Transport: transport,
+		Timeout:   30 * time.Second,
+	}
+}
+
+// ═══════════════════════════════════════════════════════════════════════════════
+// CONNECTION WARMUP
+// ═══════════════════════════════════════════════════════════════════════════════
+//
+// The first request on a cold connection pays DNS + TCP + TLS before the order
+// even leaves. We open the connection at startup and ping a cheap public
+// endpoint periodically so idle connections are never reaped between trades.
+//
+// ═══════════════════════════════════════════════════════════════════════════════
+
+const keepAliveInterval = 30 * time.Second // Well under the transport's 90s idle timeout
+
+// StartKeepAlive warms the CLOB connection now and keeps it warm until Stop
+func (c *Client) StartKeepAlive() {
+	if c.dryRun {
+		return
+	}
+
+	start := time.Now()
+	if err := c.ping(); err != nil {
+		log.Warn().Err(err).Msg("⚠️ CLOB warmup failed")
+	} else {
+		log.Info().Dur("latency", time.Since(start)).Msg("🔥 CLOB connection warmed")
+	}
+
+	go func() {
+		ticker := time.NewTicker(keepAliveInterval)
+		defer ticker.Stop()
+
+		for {
+			select {
+			case <-c.stopCh:
+				return
+			case <-ticker.C:
+				if err := c.ping(); err != nil {
+					log.Debug().Err(err).Msg("CLOB keepalive failed")
+				}
+			}
+		}
+	}()
+}
+
+// Stop ends the keepalive loop
+func (c *Client) Stop() {
+	c.stopOnce.Do(func() { close(c.stopCh) })
+}
+
+// ping hits the unauthenticated server-time endpoint and drains the response
+func (c *Client) ping() error {
+	resp, err := c.httpClient.Get(c.baseURL + "/time")
+	if err != nil {
+		return err
+	}
+	defer resp.Body.Close()
+
+	_, err = io.Copy(io.Discard, resp.Body)
+	return err
+}
+
 // ═══════════════════════════════════════════════════════════════════════════════
 // ORDER TYPES & STRUCTURES
 // ═══════════════════════════════════════════════════════════════════════════════
@@ -201,6 +320,106 @@ func (c *Client) PlaceOrderWithType(tokenID string, price, size decimal.Decimal,
 		return "", fmt.Errorf("build order failed: %w", err)
 	}
 
+	return c.postSignedOrder(signedOrder, orderType, postOnly)
+}
+
+// clientOrder is a signed order kept for retries, with the parameters it was built from
+type clientOrder struct {
+	order    *SignedOrder
+	tokenID  string
+	price    decimal.Decimal
+	size     decimal.Decimal
+	side     string
+	signedAt time.Time
+}
+
+// matches reports whether a resubmit asks for the same order that was signed
+func (o *clientOrder) matches(tokenID string, price, size decimal.Decimal, side string) bool {
+	return o.tokenID == tokenID &&
+		o.price.Equal(price) &&
+		o.size.Equal(size) &&
+		strings.EqualFold(o.side, side)
+}
+
+// PlaceOrderIdempotent places a GTC limit order keyed by a caller-supplied client ID
+// Retrying with the same client ID resubmits the identical signed order (same salt).
+// If an earlier attempt already landed, the CLOB rejects the retry as a duplicate;
+// that counts as the ack, and the order ID is the EIP-712 digest computed locally.
+// Reusing a client ID with different parameters is rejected, not silently re-posted
+func (c *Client) PlaceOrderIdempotent(clientID, tokenID string, price, size decimal.Decimal, side string) (string, error) {
+	if c.dryRun {
+		return c.PlaceOrderWithType(tokenID, price, size, side, OrderTypeGTC, false)
+	}
+
+	// Sign under the lock so concurrent attempts for one client ID share a salt
+	c.clientOrdersMu.Lock()
+	c.pruneClientOrders()
+	cached, ok := c.signedOrders[clientID]
+	if ok && !cached.matches(tokenID, price, size, side) {
+		c.clientOrdersMu.Unlock()
+		return "", fmt.Errorf("client ID %s reused with different order parameters", clientID)
+	}
+	if !ok {
+		signedOrder, err := c.buildSignedOrder(tokenID, price, size, side, OrderTypeGTC)
+		if err != nil {
+			c.clientOrdersMu.Unlock()
+			return "", fmt.Errorf("build order failed: %w", err)
+		}
+		cached = &clientOrder{
+			order:    signedOrder,
+			tokenID:  tokenID,
+			price:    price,
+			size:     size,
+			side:     side,
+			signedAt: time.Now(),
+		}
+		c.signedOrders[clientID] = cached
+	}
+	c.clientOrdersMu.Unlock()
+	signedOrder := cached.order
+
+	orderID, err := c.postSignedOrder(signedOrder, OrderTypeGTC, false)
+	if err != nil {
+		if !isDuplicateOrderError(err) {
+			return "", err
+		}
+
+		orderID = orderHash(signedOrder)
+		c.invalidateBalance()
+		log.Info().
+			Str("client_id", clientID).
+			Str("order_id", orderID).
+			Msg("✅ Order already on book, duplicate treated as ack")
+	}
+
+	return orderID, nil
+}
+
+// ForgetClientOrder drops idempotency state once the caller has settled an order
+// Until then (or signedOrderTTL) a resubmit of the client ID reuses the same signed order
+func (c *Client) ForgetClientOrder(clientID string) {
+	c.clientOrdersMu.Lock()
+	defer c.clientOrdersMu.Unlock()
+	delete(c.signedOrders, clientID)
+}
+
+// pruneClientOrders drops signed orders nobody retried within signedOrderTTL
+// Caller must hold clientOrdersMu
+func (c *Client) pruneClientOrders() {
+	for clientID, cached := range c.signedOrders {
+		if time.Since(cached.signedAt) > signedOrderTTL {
+			delete(c.signedOrders, clientID)
+		}
+	}
+}
+
+// isDuplicateOrderError reports whether the CLOB rejected an order it already holds
+func isDuplicateOrderError(err error) bool {
+	return strings.Contains(strings.ToLower(err.Error()), "duplicat")
+}
+
+// postSignedOrder submits an already-signed order to the CLOB
+func (c *Client) postSignedOrder(signedOrder *SignedOrder, orderType OrderType, postOnly bool) (string, error) {
 	// Create order payload
 	payload := OrderPayload{
 		Order:     *signedOrder,
@@ -228,6 +447,7 @@ func (c *Client) PlaceOrderWithType(tokenID string, price, size decimal.Decimal,
 	if result.ErrorMsg != "" {
 		return "", fmt.Errorf("API error: %s", result.ErrorMsg)
 	}
+	c.invalidateBalance()
 
 	log.Info().
 		Str("order_id", result.OrderID).
@@ -311,22 +531,8 @@ func (c *Client) signOrderEIP712(order *SignedOrder) (string, error) {
 		return "", fmt.Errorf("private key not loaded")
 	}
 
-	// EIP-712 Domain Separator for Polymarket CTF Exchange
-	domainSeparator := buildDomainSeparator(CTFExchange, ChainID)
-
-	// Build order struct hash
-	orderHash := buildOrderStructHash(order)
-
-	// Combine: keccak256("\x19\x01" + domainSeparator + orderHash)
-	var data []byte
-	data = append(data, []byte("\x19\x01")...)
-	data = append(data, domainSeparator[:]...)
-	data = append(data, orderHash[:]...)
-	
-	finalHash := crypto.Keccak256(data)
-
 	// Sign the hash
-	sig, err := crypto.Sign(finalHash, c.privateKey)
+	sig, err := crypto.Sign(orderDigest(order), c.privateKey)
 	if err != nil {
 		return "", err
 	}
@@ -339,6 +545,32 @@ func (c *Client) signOrderEIP712(order *SignedOrder) (string, error) {
 	return hexutil.Encode(sig), nil
 }
 
+// orderDigest is the EIP-712 hash that gets signed: keccak256("\x19\x01" + domainSeparator + structHash)
+func orderDigest(order *SignedOrder) []byte {
+	structHash := buildOrderStructHash(order)
+
+	data := make([]byte, 0, 2+32+32)
+	data = append(data, []byte("\x19\x01")...)
+	data = append(data, ctfDomainSeparator[:]...)
+	data = append(data, structHash[:]...)
+
+	return crypto.Keccak256(data)
+}
+
+// orderHash returns the order's CLOB ID (the hex EIP-712 digest)
+func orderHash(order *SignedOrder) string {
+	return hexutil.Encode(orderDigest(order))
+}
+
+// EIP-712 constants - hashed once at startup instead of on every order
+var (
+	// Domain Separator for Polymarket CTF Exchange
+	ctfDomainSeparator = buildDomainSeparator(CTFExchange, ChainID)
+
+	// Order type hash
+	orderTypeHash = crypto.Keccak256([]byte("Order(uint256 salt,address maker,address signer,address taker,uint256 tokenId,uint256 makerAmount,uint256 takerAmount,uint256 expiration,uint256 nonce,uint256 feeRateBps,uint8 side,uint8 signatureType)"))
+)
+
 // buildDomainSeparator creates the EIP-712 domain separator
 func buildDomainSeparator(contractAddr string, chainID int) [32]byte {
 	// EIP-712 Domain type hash
@@ -368,9 +600,6 @@ func buildDomainSeparator(contractAddr string, chainID int) [32]byte {
 
 // buildOrderStructHash creates the EIP-712 struct hash for an order
 func buildOrderStructHash(order *SignedOrder) [32]byte {
-	// Order type hash
-	orderTypeHash := crypto.Keccak256([]byte("Order(uint256 salt,address maker,address signer,address taker,uint256 tokenId,uint256 makerAmount,uint256 takerAmount,uint256 expiration,uint256 nonce,uint256 feeRateBps,uint8 side,uint8 signatureType)"))
-
 	salt := padUint256(order.Salt)
 	maker := common.LeftPadBytes(common.HexToAddress(order.Maker).Bytes(), 32)
 	signer := common.LeftPadBytes(common.HexToAddress(order.Signer).Bytes(), 32)
@@ -392,7 +621,7 @@ func buildOrderStructHash(order *SignedOrder) [32]byte {
 	// Signature type
 	sigTypePadded := common.LeftPadBytes([]byte{byte(order.SignatureType)}, 32)
 
-	var data []byte
+	data := make([]byte, 0, 13*32) // Type hash + 12 encoded fields
 	data = append(data, orderTypeHash...)
 	data = append(data, salt...)
 	data = append(data, maker...)
@@ -450,6 +679,7 @@ func (c *Client) CancelOrder(orderID string) error {
 	if err != nil {
 		return fmt.Errorf("cancel order failed: %w", err)
 	}
+	c.invalidateBalance()
 	
 	log.Info().Str("order_id", orderID).Msg("🗑️ Order cancelled")
 	return nil
@@ -466,27 +696,77 @@ func (c *Client) CancelAllOrders() error {
 	if err != nil {
 		return fmt.Errorf("cancel all orders failed: %w", err)
 	}
+	c.invalidateBalance()
 	
 	log.Info().Msg("🗑️ All orders cancelled")
 	return nil
 }
 
 // GetBalance returns current balance from Polymarket
+// Results are cached for balanceCacheTTL so status checks don't burn rate limit
 func (c *Client) GetBalance() (decimal.Decimal, error) {
 	if c.dryRun {
 		return decimal.NewFromFloat(100), nil // Simulated balance
 	}
 
+	c.balanceMu.Lock()
+	if !c.balanceAt.IsZero() && time.Since(c.balanceAt) < balanceCacheTTL {
+		balance := c.balance
+		c.balanceMu.Unlock()
+		return balance, nil
+	}
+	c.balanceMu.Unlock()
+
+	return c.RefreshBalance()
+}
+
+// RefreshBalance fetches the balance from the exchange, bypassing the cache
+func (c *Client) RefreshBalance() (decimal.Decimal, error) {
+	if c.dryRun {
+		return decimal.NewFromFloat(100), nil // Simulated balance
+	}
+
+	c.balanceMu.Lock()
+	gen := c.balanceGen
+	c.balanceMu.Unlock()
+
+	balance, err := c.fetchBalance()
+	if err != nil {
+		return balance, err
+	}
+
+	c.balanceMu.Lock()
+	if gen == c.balanceGen {
+		c.balance = balance
+		c.balanceAt = time.Now()
+	}
+	c.balanceMu.Unlock()
+
+	return balance, nil
+}
+
+// invalidateBalance forces the next GetBalance to refetch (orders and cancels move funds)
+func (c *Client) invalidateBalance() {
+	c.balanceMu.Lock()
+	c.balanceAt = time.Time{}
+	c.balanceGen++
+	c.balanceMu.Unlock()
+}
+
+// fetchBalance queries CLOB collateral first, then on-chain USDC
+func (c *Client) fetchBalance() (decimal.Decimal, error) {
 	if c.address == "" {
 		return decimal.Zero, fmt.Errorf("no wallet address")
 	}
 
 	// Try CLOB balance-allowance endpoint (COLLATERAL = USDC balance)
+	clobOK := false
 	if c.apiKey != "" && c.apiSecret != "" {
 		balance, err := c.getCLOBCollateralBalance()
 		if err == nil && !balance.IsZero() {
 			return balance, nil
 		}
+		clobOK = err == nil
 		log.Debug().Err(err).Msg("CLOB balance check failed, trying on-chain")
 	}
 
@@ -496,12 +776,36 @@ func (c *Client) GetBalance() (decimal.Decimal, error) {
 		addresses = append(addresses, c.funderAddress)
 	}
 
+	// Query all addresses at once - total latency is one RPC round-trip, not the sum
+	balances := make([]decimal.Decimal, len(addresses))
+	errs := make([]error, len(addresses))
+	var wg sync.WaitGroup
+	for i, addr := range addresses {
+		wg.Add(1)
+		go func(i int, addr string) {
+			defer wg.Done()
+			balances[i], errs[i] = c.getBalanceForAddress(addr)
+		}(i, addr)
+	}
+	wg.Wait()
+
 	totalBalance := decimal.Zero
-	for _, addr := range addresses {
-		balance, _ := c.getBalanceForAddress(addr)
+	var lastErr error
+	failed := 0
+	for i, balance := range balances {
+		if errs[i] != nil {
+			lastErr = errs[i]
+			failed++
+			continue
+		}
 		totalBalance = totalBalance.Add(balance)
 	}
 
+	// Every source failed - report it rather than a zero that would get cached
+	if failed == len(addresses) && !clobOK {
+		return decimal.Zero, fmt.Errorf("balance lookup failed: %w", lastErr)
+	}
+
 	return totalBalance, nil
 }
 
@@ -538,18 +842,35 @@ func (c *Client) getCLOBCollateralBalance() (decimal.Decimal, error) {
 func (c *Client) getBalanceForAddress(address string) (decimal.Decimal, error) {
 	// USDC.e on Polygon (what Polymarket uses)
 	usdceAddress := "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174"
-	balance, err := c.getOnChainBalanceFor(address, usdceAddress)
+	// Native USDC on Polygon
+	nativeUSDC := "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
+
+	// Fetch both tokens concurrently; native is only used when USDC.e is empty
+	var balance, balance2 decimal.Decimal
+	var err, err2 error
+	var wg sync.WaitGroup
+	wg.Add(2)
+	go func() {
+		defer wg.Done()
+		balance, err = c.getOnChainBalanceFor(address, usdceAddress)
+	}()
+	go func() {
+		defer wg.Done()
+		balance2, err2 = c.getOnChainBalanceFor(address, nativeUSDC)
+	}()
+	wg.Wait()
+
 	if err == nil && !balance.IsZero() {
 		return balance, nil
 	}
 
-	// Native USDC on Polygon
-	nativeUSDC := "0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359"
-	balance2, err := c.getOnChainBalanceFor(address, nativeUSDC)
-	if err == nil {
+	if err2 == nil {
 		return balance.Add(balance2), nil
 	}
 
+	if err != nil {
+		return decimal.Zero, err
+	}
 	return balance, nil
 }
 
@@ -579,7 +900,7 @@ func (c *Client) getOnChainBalanceFor(walletAddr, tokenAddr string) (decimal.Dec
 	}
 
 	jsonBody, _ := json.Marshal(payload)
-	resp, err := http.Post(polygonRPC, "application/json", bytes.NewBuffer(jsonBody))
+	resp, err := c.httpClient.Post(polygonRPC, "application/json", bytes.NewBuffer(jsonBody))
 	if err != nil {
 		return decimal.Zero, err
 	}
@@ -605,16 +926,33 @@ func (c *Client) getOnChainBalanceFor(walletAddr, tokenAddr string) (decimal.Dec
 	return parseHexBalance(result.Result)
 }
 
-// GetOpenOrders returns all open orders
+// GetOpenOrders returns all open orders, following the CLOB's cursor pagination
+// Each page is keyed by the previous page's cursor, so deep pages cost the same as the first
 func (c *Client) GetOpenOrders() ([]Order, error) {
-	resp, err := c.get("/orders?status=live")
-	if err != nil {
-		return nil, err
-	}
-
 	var orders []Order
-	if err := json.Unmarshal(resp, &orders); err != nil {
-		return nil, err
+
+	cursor := cursorStart
+	for cursor != "" && cursor != cursorEnd {
+		resp, err := c.get("/data/orders?next_cursor=" + url.QueryEscape(cursor))
+		if err != nil {
+			return nil, err
+		}
+
+		var page struct {
+			Data       []Order `json:"data"`
+			NextCursor string  `json:"next_cursor"`
+		}
+		if err := json.Unmarshal(resp, &page); err != nil {
+			return nil, err
+		}
+
+		orders = append(orders, page.Data...)
+
+		// A repeated cursor or empty page would otherwise loop forever
+		if page.NextCursor == cursor || len(page.Data) == 0 {
+			break
+		}
+		cursor = page.NextCursor
 	}
 
 	return orders, nil
@@ -641,18 +979,18 @@ func (c *Client) get(path string) ([]byte, error) {
 	if err != nil {
 		return nil, err
 	}
-	c.addHeaders(req)
+	c.addHeaders(req, nil)
 	return c.doRequest(req)
 }
 
 func (c *Client) post(path string, body interface{}) ([]byte, error) {
 	jsonBody, _ := json.Marshal(body)
-	req, err := http.NewRequest("POST", c.baseURL+path, bytes.NewBuffer(jsonBody))
+	req, err := http.NewRequest("POST", c.baseURL+path, bytes.NewReader(jsonBody))
 	if err != nil {
 		return nil, err
 	}
 	req.Header.Set("Content-Type", "application/json")
-	c.addHeaders(req)
+	c.addHeaders(req, jsonBody)
 	return c.doRequest(req)
 }
 
@@ -661,7 +999,7 @@ func (c *Client) delete(path string) ([]byte, error) {
 	if err != nil {
 		return nil, err
 	}
-	c.addHeaders(req)
+	c.addHeaders(req, nil)
 	return c.doRequest(req)
 }
 
@@ -670,16 +1008,18 @@ func (c *Client) deleteWithBody(path string, body interface{}) ([]byte, error) {
 	if body != nil {
 		jsonBody, _ = json.Marshal(body)
 	}
-	req, err := http.NewRequest("DELETE", c.baseURL+path, bytes.NewBuffer(jsonBody))
+	req, err := http.NewRequest("DELETE", c.baseURL+path, bytes.NewReader(jsonBody))
 	if err != nil {
 		return nil, err
 	}
 	req.Header.Set("Content-Type", "application/json")
-	c.addHeaders(req)
+	c.addHeaders(req, jsonBody)
 	return c.doRequest(req)
 }
 
-func (c *Client) addHeaders(req *http.Request) {
+// addHeaders sets L2 auth headers; body is the already-marshalled payload (nil for none)
+// Passing it in avoids reading the request body back out and re-buffering it to sign
+func (c *Client) addHeaders(req *http.Request, body []byte) {
 	timestamp := fmt.Sprintf("%d", time.Now().Unix())
 
 	// L2 Headers require POLY_ADDRESS (signer address)
@@ -691,28 +1031,23 @@ func (c *Client) addHeaders(req *http.Request) {
 	// Generate HMAC-SHA256 signature (base64 URL-safe encoded)
 	if c.apiSecret != "" {
 		// Message format: timestamp + method + requestPath (NO query params!)
-		message := timestamp + req.Method + req.URL.Path
-		
-		if req.Body != nil {
-			// Read body and reset
-			bodyBytes, _ := io.ReadAll(req.Body)
-			req.Body = io.NopCloser(bytes.NewBuffer(bodyBytes))
-			if len(bodyBytes) > 0 {
-				message += string(bodyBytes)
-			}
-		}
+		message := timestamp + req.Method + req.URL.Path + string(body)
 		signature := c.hmacSign(message)
 		req.Header.Set("POLY_SIGNATURE", signature)
 	}
 }
 
 func (c *Client) doRequest(req *http.Request) ([]byte, error) {
+	c.waitForRateLimit()
+
 	resp, err := c.httpClient.Do(req)
 	if err != nil {
 		return nil, err
 	}
 	defer resp.Body.Close()
 
+	c.updateRateLimit(resp)
+
 	body, err := io.ReadAll(resp.Body)
 	if err != nil {
 		return nil, err
@@ -726,6 +1061,140 @@ func (c *Client) doRequest(req *http.Request) ([]byte, error) {
 }
 
 // ═══════════════════════════════════════════════════════════════════════════════
+// RATE LIMITING
+// ═══════════════════════════════════════════════════════════════════════════════
+//
+// No fixed sleeps: requests go out immediately while quota is plentiful.
+// Once X-RateLimit-Remaining drops below 20% of X-RateLimit-Limit, the rest
+// of the budget is spread evenly until X-RateLimit-Reset: each caller reserves
+// the next slot, so concurrent requests queue up instead of waking together.
+// A 429 pauses for Retry-After. No slot is reserved more than 30s (the request
+// timeout) ahead, and once quota recovers the queued backlog is dropped.
+//
+// ═══════════════════════════════════════════════════════════════════════════════
+
+const (
+	rateLimitLowWater = 0.2              // Start pacing below 20% remaining
+	rateLimitMaxWait  = 30 * time.Second // Cap on any single pause (matches client timeout)
+)
+
+// waitForRateLimit reserves the next request slot and blocks until it arrives
+func (c *Client) waitForRateLimit() {
+	if wait := c.reserveRateSlot(); wait > 0 {
+		time.Sleep(wait)
+	}
+}
+
+// reserveRateSlot claims the next request slot and returns how long to wait for it
+func (c *Client) reserveRateSlot() time.Duration {
+	c.rateMu.Lock()
+	defer c.rateMu.Unlock()
+
+	now := time.Now()
+	slot := c.nextRequest
+	if slot.Before(now) {
+		slot = now
+	}
+	// Cap the reservation itself, so the backlog can't outgrow what callers wait
+	if limit := now.Add(rateLimitMaxWait); slot.After(limit) {
+		slot = limit
+	}
+	c.nextRequest = slot.Add(c.rateSpacing)
+
+	return slot.Sub(now)
+}
+
+// updateRateLimit sets the request spacing from the response's rate limit headers
+func (c *Client) updateRateLimit(resp *http.Response) {
+	now := time.Now()
+
+	if resp.StatusCode == http.StatusTooManyRequests {
+		retryAfter := headerInt(resp.Header, "Retry-After")
+		if retryAfter <= 0 {
+			retryAfter = 1
+		}
+		pause := clampRateWait(time.Duration(retryAfter) * time.Second)
+
+		c.rateMu.Lock()
+		c.pausedUntil = now.Add(pause)
+		if c.pausedUntil.After(c.nextRequest) {
+			c.nextRequest = c.pausedUntil
+		}
+		c.rateMu.Unlock()
+		return
+	}
+
+	limit := headerInt(resp.Header, "X-RateLimit-Limit")
+	remaining := headerInt(resp.Header, "X-RateLimit-Remaining")
+	if limit <= 0 || remaining < 0 || float64(remaining)/float64(limit) >= rateLimitLowWater {
+		// Quota recovered - drop slots queued while pacing, keep any 429 pause
+		c.rateMu.Lock()
+		c.rateSpacing = 0
+		if c.nextRequest.After(now) {
+			c.nextRequest = now
+			if c.pausedUntil.After(now) {
+				c.nextRequest = c.pausedUntil
+			}
+		}
+		c.rateMu.Unlock()
+		return
+	}
+
+	untilReset := time.Second
+	if reset := headerInt(resp.Header, "X-RateLimit-Reset"); reset > 0 {
+		// Reset is either a unix timestamp or seconds from now
+		if reset > 1_000_000_000 {
+			untilReset = time.Until(time.Unix(reset, 0))
+		} else {
+			untilReset = time.Duration(reset) * time.Second
+		}
+	}
+	untilReset = clampRateWait(untilReset)
+
+	c.rateMu.Lock()
+	if remaining == 0 {
+		// Budget spent - hold everything until the window resets
+		c.rateSpacing = 0
+		if next := now.Add(untilReset); next.After(c.nextRequest) {
+			c.nextRequest = next
+		}
+	} else {
+		c.rateSpacing = untilReset / time.Duration(remaining)
+	}
+	spacing := c.rateSpacing
+	c.rateMu.Unlock()
+
+	log.Debug().
+		Int64("remaining", remaining).
+		Int64("limit", limit).
+		Dur("spacing", spacing).
+		Msg("⏳ CLOB rate limit low, pacing requests")
+}
+
+// clampRateWait bounds a server-supplied wait to [0, rateLimitMaxWait]
+func clampRateWait(d time.Duration) time.Duration {
+	if d < 0 {
+		return 0
+	}
+	if d > rateLimitMaxWait {
+		return rateLimitMaxWait
+	}
+	return d
+}
+
+// headerInt parses an integer header, returning -1 if missing or invalid
+func headerInt(h http.Header, key string) int64 {
+	v := h.Get(key)
+	if v == "" {
+		return -1
+	}
+	n, err := strconv.ParseInt(v, 10, 64)
+	if err != nil {
+		return -1
+	}
+	return n
+}
+
 // ═══════════════════════════════════════════════════════════════════════════════
 // HMAC SIGNING (for API authentication)
 // ═══════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,217 @@
+package exec
+
+import (
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/ethereum/go-ethereum/crypto"
+	"github.com/shopspring/decimal"
+)
+
+// newTestClient builds a live-mode client pointed at a stub CLOB
+func newTestClient(t *testing.T, baseURL string, timeout time.Duration) *Client {
+	t.Helper()
+
+	pk, err := crypto.GenerateKey()
+	if err != nil {
+		t.Fatalf("generate key: %v", err)
+	}
+
+	return &Client{
+		baseURL:      baseURL,
+		privateKey:   pk,
+		address:      crypto.PubkeyToAddress(pk.PublicKey).Hex(),
+		sigType:      SigTypeEOA,
+		httpClient:   &http.Client{Timeout: timeout},
+		signedOrders: make(map[string]*clientOrder),
+		stopCh:       make(chan struct{}),
+	}
+}
+
+// A first attempt that lands but times out client-side must not turn into a
+// failure or a second order: the retry resubmits the same signed order, the
+// CLOB rejects it as a duplicate, and that is reported as the ack
+func TestPlaceOrderIdempotentTimeoutThenDuplicate(t *testing.T) {
+	var mu sync.Mutex
+	var salts []string
+
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		var payload OrderPayload
+		if err := json.NewDecoder(r.Body).Decode(&payload); err != nil {
+			t.Errorf("decode payload: %v", err)
+			return
+		}
+
+		mu.Lock()
+		salts = append(salts, payload.Order.Salt)
+		attempt := len(salts)
+		mu.Unlock()
+
+		if attempt == 1 {
+			// Order is accepted, but the response arrives after the client gave up
+			time.Sleep(200 * time.Millisecond)
+			json.NewEncoder(w).Encode(map[string]interface{}{
+				"orderID": orderHash(&payload.Order),
+				"status":  "live",
+				"success": true,
+			})
+			return
+		}
+
+		w.WriteHeader(http.StatusBadRequest)
+		json.NewEncoder(w).Encode(map[string]string{
+			"error": "order " + orderHash(&payload.Order) + " is invalid. Duplicated.",
+		})
+	}))
+	defer srv.Close()
+
+	client := newTestClient(t, srv.URL, 50*time.Millisecond)
+	price := decimal.NewFromFloat(0.55)
+	size := decimal.NewFromInt(10)
+
+	if _, err := client.PlaceOrderIdempotent("PB_1_BTC", "12345", price, size, SideBuy); err == nil {
+		t.Fatal("first attempt: expected timeout error")
+	}
+
+	orderID, err := client.PlaceOrderIdempotent("PB_1_BTC", "12345", price, size, SideBuy)
+	if err != nil {
+		t.Fatalf("retry: duplicate should count as ack, got %v", err)
+	}
+
+	mu.Lock()
+	defer mu.Unlock()
+
+	if len(salts) != 2 {
+		t.Fatalf("expected 2 submissions, got %d", len(salts))
+	}
+	if salts[0] != salts[1] {
+		t.Fatalf("retry re-signed the order: salt %s != %s", salts[0], salts[1])
+	}
+
+	cached := client.signedOrders["PB_1_BTC"]
+	if cached == nil {
+		t.Fatal("signed order dropped before the caller settled it")
+	}
+	if want := orderHash(cached.order); orderID != want {
+		t.Fatalf("order ID = %s, want digest %s", orderID, want)
+	}
+}
+
+// Resubmitting a failed client ID with new parameters must not post the old order
+func TestPlaceOrderIdempotentRejectsChangedParams(t *testing.T) {
+	var mu sync.Mutex
+	posts := 0
+
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		mu.Lock()
+		posts++
+		mu.Unlock()
+		w.WriteHeader(http.StatusInternalServerError)
+	}))
+	defer srv.Close()
+
+	client := newTestClient(t, srv.URL, time.Second)
+	size := decimal.NewFromInt(10)
+
+	if _, err := client.PlaceOrderIdempotent("PB_2_ETH", "12345", decimal.NewFromFloat(0.55), size, SideBuy); err == nil {
+		t.Fatal("first attempt: expected server error")
+	}
+	if _, err := client.PlaceOrderIdempotent("PB_2_ETH", "12345", decimal.NewFromFloat(0.60), size, SideBuy); err == nil {
+		t.Fatal("changed price: expected rejection")
+	}
+
+	mu.Lock()
+	defer mu.Unlock()
+	if posts != 1 {
+		t.Fatalf("expected 1 submission, got %d", posts)
+	}
+}
+
+// Signed orders nobody retries are freed after signedOrderTTL
+func TestPruneClientOrders(t *testing.T) {
+	client := &Client{signedOrders: map[string]*clientOrder{
+		"stale": {signedAt: time.Now().Add(-signedOrderTTL - time.Minute)},
+		"fresh": {signedAt: time.Now()},
+	}}
+
+	client.pruneClientOrders()
+
+	if _, ok := client.signedOrders["stale"]; ok {
+		t.Fatal("stale signed order not pruned")
+	}
+	if _, ok := client.signedOrders["fresh"]; !ok {
+		t.Fatal("fresh signed order pruned")
+	}
+}
+
+// rateLimitResponse builds a response carrying X-RateLimit-* headers
+func rateLimitResponse(status int, limit, remaining, reset string) *http.Response {
+	h := http.Header{}
+	h.Set("X-RateLimit-Limit", limit)
+	h.Set("X-RateLimit-Remaining", remaining)
+	h.Set("X-RateLimit-Reset", reset)
+	return &http.Response{StatusCode: status, Header: h}
+}
+
+// Slots reserved while pacing must be capped, and dropped once quota recovers,
+// so calls don't keep stalling after the rate limit has already cleared
+func TestRateLimitLowThenRecovered(t *testing.T) {
+	client := &Client{}
+
+	// 5 of 100 left, resetting in 10s -> 2s spacing
+	client.updateRateLimit(rateLimitResponse(http.StatusOK, "100", "5", "10"))
+
+	var mu sync.Mutex
+	var maxWait time.Duration
+	var wg sync.WaitGroup
+	for i := 0; i < 20; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			wait := client.reserveRateSlot()
+			mu.Lock()
+			if wait > maxWait {
+				maxWait = wait
+			}
+			mu.Unlock()
+		}()
+	}
+	wg.Wait()
+
+	if maxWait < 30*time.Second-time.Second {
+		t.Fatalf("concurrent callers were not spaced out: max wait %v", maxWait)
+	}
+	if maxWait > rateLimitMaxWait {
+		t.Fatalf("reserved slot %v exceeds cap %v", maxWait, rateLimitMaxWait)
+	}
+	if ahead := time.Until(client.nextRequest); ahead > rateLimitMaxWait+2*time.Second {
+		t.Fatalf("backlog grew to %v past the cap", ahead)
+	}
+
+	// Quota is back - the next request goes out immediately
+	client.updateRateLimit(rateLimitResponse(http.StatusOK, "100", "100", "10"))
+	if wait := client.reserveRateSlot(); wait > 0 {
+		t.Fatalf("still blocked %v after quota recovered", wait)
+	}
+	if wait := client.reserveRateSlot(); wait > 0 {
+		t.Fatalf("spacing not reset after recovery: %v", wait)
+	}
+}
+
+// A 429 pause outlives a later healthy response
+func TestRateLimitRecoveryKeepsRetryAfter(t *testing.T) {
+	client := &Client{}
+
+	resp := rateLimitResponse(http.StatusTooManyRequests, "", "", "")
+	resp.Header.Set("Retry-After", "5")
+	client.updateRateLimit(resp)
+
+	client.updateRateLimit(rateLimitResponse(http.StatusOK, "100", "100", "10"))
+	if wait := client.reserveRateSlot(); wait < 4*time.Second || wait > 5*time.Second {
+		t.Fatalf("expected ~5s Retry-After pause, got %v", wait)
+	}
+}
@@ -174,6 +174,26 @@ func (e *Executor) SubmitOrder(order *Order) (*Order, error) {
 		order.ClientID = fmt.Sprintf("PB_%d_%s", time.Now().UnixNano(), order.Asset)
 	}
 
+	// Idempotency: a resubmit of an order we already got an ack for is a no-op,
+	// and one still in flight is rejected rather than sent a second time
+	if existing, ok := e.orders[order.ClientID]; ok {
+		if existing.AckTime != nil {
+			e.mu.Unlock()
+			log.Warn().
+				Str("client_id", order.ClientID).
+				Str("state", string(existing.State)).
+				Msg("⚠️ Duplicate submit ignored")
+			return existing, nil
+		}
+		if existing.State == OrderStatePending {
+			e.mu.Unlock()
+			log.Warn().
+				Str("client_id", order.ClientID).
+				Msg("⚠️ Duplicate submit rejected, order still in flight")
+			return existing, fmt.Errorf("order %s already in flight", order.ClientID)
+		}
+	}
+
 	order.State = OrderStatePending
 	order.SubmitTime = time.Now()
 	order.FilledSize = decimal.Zero
@@ -277,12 +297,16 @@ func (e *Executor) executeLive(order *Order) (*Order, error) {
 	var orderID string
 	var err error
 
-	// Retry loop
+	// Retry loop - every attempt reuses the client ID, so a retry after an
+	// ambiguous failure resubmits the same signed order instead of a new one.
+	// On failure the signed order is kept (up to 15 min), so a later
+	// resubmit of this client ID can still match an attempt that actually landed
 	for attempt := 0; attempt <= e.config.MaxRetries; attempt++ {
 		order.RetryCount = attempt
 
 		// Submit to CLOB
-		orderID, err = e.client.PlaceOrder(
+		orderID, err = e.client.PlaceOrderIdempotent(
+			order.ClientID,
 			order.TokenID,
 			order.Price,
 			order.Size,
@@ -324,7 +348,8 @@ func (e *Executor) executeLive(order *Order) (*Order, error) {
 		return order, fmt.Errorf("order failed: %w", err)
 	}
 
-	// Success
+	// Success - the order is settled, so its signed copy is no longer needed
+	e.client.ForgetClientOrder(order.ClientID)
 	order.ID = orderID
 	now := time.Now()
 	order.AckTime = &now
@@ -1,10 +1,7 @@
 package feeds
 
 import (
-	"encoding/json"
 	"fmt"
-	"io"
-	"net/http"
 	"sync"
 	"time"
 
@@ -145,12 +142,26 @@ func (f *BinanceFeed) pollLoop() {
 }
 
 // fetchPrices gets current prices from Binance
+// Symbols are fetched in parallel so one poll costs a single round-trip, not one per symbol
 func (f *BinanceFeed) fetchPrices(symbols []string) {
-	for _, symbol := range symbols {
-		price, err := f.fetchPrice(symbol)
-		if err != nil {
+	prices := make([]decimal.Decimal, len(symbols))
+	errs := make([]error, len(symbols))
+
+	var wg sync.WaitGroup
+	for i, symbol := range symbols {
+		wg.Add(1)
+		go func(i int, symbol string) {
+			defer wg.Done()
+			prices[i], errs[i] = f.fetchPrice(symbol)
+		}(i, symbol)
+	}
+	wg.Wait()
+
+	for i, symbol := range symbols {
+		if errs[i] != nil {
 			continue
 		}
+		price := prices[i]
 
 		f.mu.Lock()
 		oldPrice := f.prices[symbol]
@@ -173,22 +184,17 @@ func (f *BinanceFeed) fetchPrices(symbols []string) {
 func (f *BinanceFeed) fetchPrice(symbol string) (decimal.Decimal, error) {
 	url := fmt.Sprintf("%s?symbol=%s", binanceAPIURL, symbol)
 
-	resp, err := http.Get(url)
+	resp, err := httpClient.Get(url)
 	if err != nil {
 		return decimal.Zero, err
 	}
 	defer resp.Body.Close()
 
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return decimal.Zero, err
-	}
-
 	var result struct {
 		Price string `json:"price"`
 	}
 
-	if err := json.Unmarshal(body, &result); err != nil {
+	if err := decodeJSON(resp.Body, &result); err != nil {
 		return decimal.Zero, err
 	}
 
@@ -216,20 +222,15 @@ func (f *BinanceFeed) GetHistoricalPrice(symbol string, timestamp int64) (decima
 	url := fmt.Sprintf("https://api.binance.com/api/v3/klines?symbol=%sUSDT&interval=1m&startTime=%d&limit=1",
 		symbol, timestamp*1000) // Binance uses milliseconds
 
-	resp, err := http.Get(url)
+	resp, err := httpGetWithRetry(url)
 	if err != nil {
 		return decimal.Zero, err
 	}
 	defer resp.Body.Close()
 
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return decimal.Zero, err
-	}
-
 	// Response is array of arrays: [[openTime, open, high, low, close, volume, ...]]
 	var klines [][]interface{}
-	if err := json.Unmarshal(body, &klines); err != nil {
+	if err := decodeJSON(resp.Body, &klines); err != nil {
 		return decimal.Zero, err
 	}
 
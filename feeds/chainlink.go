@@ -1,9 +1,8 @@
 package feeds
 
 import (
-	"encoding/json"
+	"context"
 	"fmt"
-	"io"
 	"net/http"
 	"sync"
 	"time"
@@ -32,7 +31,8 @@ const (
 	chainlinkAPIURL = "https://api.chain.link/v1/query"
 	
 	// CMC API (free tier)
-	cmcAPIURL = "https://pro-api.coinmarketcap.com/v1/cryptocurrency/quotes/latest"
+	cmcAPIURL  = "https://pro-api.coinmarketcap.com/v1/cryptocurrency/quotes/latest"
+	cmcTimeout = 5 * time.Second
 	
 	// Backup: CryptoCompare (no key needed)
 	cryptoCompareURL = "https://min-api.cryptocompare.com/data/pricemultifull"
@@ -172,7 +172,7 @@ func (f *ChainlinkFeed) fetchFromCryptoCompare(assets []string) bool {
 
 	url := fmt.Sprintf("%s?fsyms=%s&tsyms=USD", cryptoCompareURL, symbols)
 
-	resp, err := http.Get(url)
+	resp, err := httpClient.Get(url)
 	if err != nil {
 		return false
 	}
@@ -182,11 +182,6 @@ func (f *ChainlinkFeed) fetchFromCryptoCompare(assets []string) bool {
 		return false
 	}
 
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return false
-	}
-
 	// Parse response
 	var result struct {
 		RAW map[string]struct {
@@ -196,7 +191,7 @@ func (f *ChainlinkFeed) fetchFromCryptoCompare(assets []string) bool {
 		} `json:"RAW"`
 	}
 
-	if err := json.Unmarshal(body, &result); err != nil {
+	if err := decodeJSON(resp.Body, &result); err != nil {
 		return false
 	}
 
@@ -241,15 +236,18 @@ func (f *ChainlinkFeed) fetchFromCMC(assets []string) bool {
 
 	url := fmt.Sprintf("%s?symbol=%s", cmcAPIURL, symbols)
 
-	req, err := http.NewRequest("GET", url, nil)
+	// Shared pooled client; the 5s budget is applied per request
+	ctx, cancel := context.WithTimeout(context.Background(), cmcTimeout)
+	defer cancel()
+
+	req, err := http.NewRequestWithContext(ctx, "GET", url, nil)
 	if err != nil {
 		return false
 	}
 	req.Header.Set("X-CMC_PRO_API_KEY", f.cmcAPIKey)
 	req.Header.Set("Accept", "application/json")
 
-	client := &http.Client{Timeout: 5 * time.Second}
-	resp, err := client.Do(req)
+	resp, err := httpClient.Do(req)
 	if err != nil {
 		return false
 	}
@@ -259,11 +257,6 @@ func (f *ChainlinkFeed) fetchFromCMC(assets []string) bool {
 		return false
 	}
 
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return false
-	}
-
 	// Parse CMC response
 	var result struct {
 		Data map[string]struct {
@@ -275,7 +268,7 @@ func (f *ChainlinkFeed) fetchFromCMC(assets []string) bool {
 		} `json:"data"`
 	}
 
-	if err := json.Unmarshal(body, &result); err != nil {
+	if err := decodeJSON(resp.Body, &result); err != nil {
 		return false
 	}
 
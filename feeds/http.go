@@ -0,0 +1,123 @@
+package feeds
+
+import (
+	"encoding/json"
+	"fmt"
+	"io"
+	"net"
+	"net/http"
+	"strconv"
+	"time"
+)
+
+// ═══════════════════════════════════════════════════════════════════════════════
+// HTTP CLIENT - Shared pooled client for REST feeds
+// ═══════════════════════════════════════════════════════════════════════════════
+//
+// All REST pollers hit a handful of hosts over and over (Binance every 100ms,
+// Gamma every window). One pooled client keeps those connections warm so each
+// request skips the TCP+TLS handshake.
+//
+// Retries:
+//   - 429 / 502 / 503 / 504 and network errors are retried with backoff
+//   - 429 honours Retry-After when the server sends it (capped at httpReadTimeout)
+//   - Fast pollers use httpClient directly (the next tick is the retry)
+//
+// ═══════════════════════════════════════════════════════════════════════════════
+
+const (
+	httpConnectTimeout  = 3 * time.Second
+	httpReadTimeout     = 30 * time.Second
+	httpMaxIdlePerHost  = 16
+	httpMaxConnsPerHost = 16 // Caps parallel fan-out against any single API
+	httpMaxRetries      = 5
+	httpBackoffBase     = 300 * time.Millisecond
+)
+
+// httpClient is shared by every feed in this package
+var httpClient = newHTTPClient()
+
+// newHTTPClient builds a keep-alive client with separate connect/read timeouts
+func newHTTPClient() *http.Client {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.DialContext = (&net.Dialer{
+		Timeout:   httpConnectTimeout,
+		KeepAlive: 30 * time.Second,
+	}).DialContext
+	transport.MaxIdleConns = 4 * httpMaxIdlePerHost
+	transport.MaxIdleConnsPerHost = httpMaxIdlePerHost
+	transport.MaxConnsPerHost = httpMaxConnsPerHost
+	transport.ResponseHeaderTimeout = httpReadTimeout
+
+	return &http.Client{
+		Transport: transport,
+		Timeout:   httpReadTimeout,
+	}
+}
+
+// httpGetWithRetry performs a GET, retrying transient failures with exponential backoff
+func httpGetWithRetry(url string) (*http.Response, error) {
+	var lastErr error
+	backoff := httpBackoffBase
+
+	for attempt := 0; attempt <= httpMaxRetries; attempt++ {
+		resp, err := httpClient.Get(url)
+		if err == nil && !isRetryableStatus(resp.StatusCode) {
+			return resp, nil
+		}
+
+		wait := backoff
+		if err != nil {
+			lastErr = err
+		} else {
+			lastErr = fmt.Errorf("HTTP %d", resp.StatusCode)
+			if retryAfter := parseRetryAfter(resp.Header.Get("Retry-After")); retryAfter > 0 {
+				wait = retryAfter
+			}
+			// A huge Retry-After would stall the caller past the windows it serves
+			if wait > httpReadTimeout {
+				wait = httpReadTimeout
+			}
+			resp.Body.Close()
+		}
+
+		if attempt < httpMaxRetries {
+			time.Sleep(wait)
+			backoff *= 2
+		}
+	}
+
+	return nil, lastErr
+}
+
+// isRetryableStatus reports whether a status code is worth retrying
+func isRetryableStatus(code int) bool {
+	switch code {
+	case http.StatusTooManyRequests,
+		http.StatusBadGateway,
+		http.StatusServiceUnavailable,
+		http.StatusGatewayTimeout:
+		return true
+	}
+	return false
+}
+
+// parseRetryAfter parses a Retry-After header given in seconds
+func parseRetryAfter(value string) time.Duration {
+	if value == "" {
+		return 0
+	}
+	secs, err := strconv.Atoi(value)
+	if err != nil || secs <= 0 {
+		return 0
+	}
+	return time.Duration(secs) * time.Second
+}
+
+// decodeJSON streams a response body straight into v without buffering it first
+// The remainder is drained so the keep-alive connection goes back to the pool
+func decodeJSON(body io.Reader, v interface{}) error {
+	err := json.NewDecoder(body).Decode(v)
+	io.Copy(io.Discard, body)
+	return err
+}
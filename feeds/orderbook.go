@@ -108,9 +108,22 @@ func parseLevelsInterface(data [][]interface{}) []Level {
 		if len(row) < 2 {
 			continue
 		}
-		price, _ := decimal.NewFromString(fmt.Sprintf("%v", row[0]))
-		size, _ := decimal.NewFromString(fmt.Sprintf("%v", row[1]))
-		levels = append(levels, Level{Price: price, Size: size})
+		levels = append(levels, Level{Price: levelValue(row[0]), Size: levelValue(row[1])})
 	}
 	return levels
 }
+
+// levelValue converts a raw WS price/size to decimal
+// Strings and numbers are handled directly; fmt formatting is only the fallback
+func levelValue(v interface{}) decimal.Decimal {
+	switch val := v.(type) {
+	case string:
+		d, _ := decimal.NewFromString(val)
+		return d
+	case float64:
+		return decimal.NewFromFloat(val)
+	default:
+		d, _ := decimal.NewFromString(fmt.Sprintf("%v", val))
+		return d
+	}
+}
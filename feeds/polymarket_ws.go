@@ -1,6 +1,7 @@
 package feeds
 
 import (
+	"bytes"
 	"encoding/json"
 	"sync"
 	"time"
@@ -58,6 +59,9 @@ type PolymarketFeed struct {
 
 	// Price cache for quick lookups
 	prices map[string]decimal.Decimal // "market:side" -> price
+
+	// Last book hash per asset (drops resent identical snapshots)
+	bookHashes map[string]string
 }
 
 // NewPolymarketFeed creates a new feed instance
@@ -68,6 +72,7 @@ func NewPolymarketFeed() *PolymarketFeed {
 		subscribers: make([]chan Tick, 0),
 		orderbooks:  make(map[string]*Orderbook),
 		prices:      make(map[string]decimal.Decimal),
+		bookHashes:  make(map[string]string),
 	}
 }
 
@@ -151,6 +156,8 @@ func (f *PolymarketFeed) connect() error {
 	f.mu.Lock()
 	f.conn = conn
 	f.connected = true
+	// Books may have gone stale while disconnected - accept the next snapshot
+	f.bookHashes = make(map[string]string)
 	f.mu.Unlock()
 
 	log.Info().Msg("🔌 WebSocket connected")
@@ -240,15 +247,44 @@ type WSMessage struct {
 	Asset     string          `json:"asset_id"`
 	Price     string          `json:"price"`
 	Side      string          `json:"side"`
+	Hash      string          `json:"hash"`
 	Bids      [][]interface{} `json:"bids"`
 	Asks      [][]interface{} `json:"asks"`
 }
 
+// handledEventTypes are the event_type values processMessage acts on, as raw JSON strings
+var handledEventTypes = [][]byte{
+	[]byte(`"book"`),
+	[]byte(`"price_change"`),
+	[]byte(`"last_trade_price"`),
+}
+
+// hasHandledEvent checks the raw frame for an event type we care about
+// Frames that can't match (tick_size_change, pongs, acks) skip JSON parsing entirely
+func hasHandledEvent(data []byte) bool {
+	for _, eventType := range handledEventTypes {
+		if bytes.Contains(data, eventType) {
+			return true
+		}
+	}
+	return false
+}
+
 // processMessage handles incoming WebSocket messages
 func (f *PolymarketFeed) processMessage(data []byte) {
+	if !hasHandledEvent(data) {
+		return
+	}
+
+	// Pick the shape from the first byte so single-object frames are parsed once,
+	// not after a failed attempt to parse them as an array
 	var msgs []WSMessage
-	if err := json.Unmarshal(data, &msgs); err != nil {
-		// Try single message
+	if trimmed := bytes.TrimLeft(data, " \t\r\n"); len(trimmed) > 0 && trimmed[0] == '[' {
+		if err := json.Unmarshal(trimmed, &msgs); err != nil {
+			return
+		}
+	} else {
+		// Single message
 		var msg WSMessage
 		if err := json.Unmarshal(data, &msg); err != nil {
 			return
@@ -271,6 +307,17 @@ func (f *PolymarketFeed) processMessage(data []byte) {
 // handleBookUpdate processes orderbook updates
 func (f *PolymarketFeed) handleBookUpdate(msg WSMessage) {
 	f.mu.Lock()
+	// Same hash = same book since the last snapshot (resubscribes resend them)
+	// Skip re-parsing levels and re-broadcasting a tick nothing changed in.
+	// Reconnects clear the hashes so the first snapshot after an outage applies
+	if msg.Hash != "" {
+		if f.bookHashes[msg.Asset] == msg.Hash {
+			f.mu.Unlock()
+			return
+		}
+		f.bookHashes[msg.Asset] = msg.Hash
+	}
+
 	ob, exists := f.orderbooks[msg.Asset]
 	if !exists {
 		ob = NewOrderbook(msg.Market, msg.Asset)
@@ -3,8 +3,6 @@ package feeds
 import (
 	"encoding/json"
 	"fmt"
-	"io"
-	"net/http"
 	"strings"
 	"sync"
 	"time"
@@ -38,6 +36,9 @@ import (
 
 const (
 	polymarketAPI = "https://gamma-api.polymarket.com"
+
+	// Max in-flight Gamma API requests when fetching all assets at once
+	maxConcurrentFetches = 3
 )
 
 // SnapshotSaver interface for database
@@ -279,7 +280,7 @@ func (s *WindowScanner) scanLoop() {
 
 // captureWindowStart captures Chainlink price at exact window start (= price to beat)
 func (s *WindowScanner) captureWindowStart(assets []string, windowStart int64) {
-	for _, asset := range assets {
+	s.forEachAsset(assets, func(asset string) {
 		assetUpper := strings.ToUpper(asset)
 		
 		// Get Chainlink price RIGHT NOW (this is the price to beat)
@@ -293,7 +294,7 @@ func (s *WindowScanner) captureWindowStart(assets []string, windowStart int64) {
 		
 		// Fetch window from API with price to beat
 		s.fetchUpDownWindowWithPrice(asset, windowStart, priceToBeat)
-	}
+	})
 
 	log.Info().
 		Int64("window_start", windowStart).
@@ -307,13 +308,13 @@ func (s *WindowScanner) fetchCurrentWindows(assets []string) {
 	interval := int64(900)
 	currentWindowStart := (now / interval) * interval
 
-	for _, asset := range assets {
+	s.forEachAsset(assets, func(asset string) {
 		assetUpper := strings.ToUpper(asset)
 		// Get current Chainlink price as approximate price to beat
 		// (we missed the exact start, so use current as approximation)
 		priceToBeat := s.priceFeed.GetPrice(assetUpper)
 		s.fetchUpDownWindowWithPrice(asset, currentWindowStart, priceToBeat)
-	}
+	})
 
 	log.Info().
 		Int64("window_start", currentWindowStart).
@@ -321,6 +322,25 @@ func (s *WindowScanner) fetchCurrentWindows(assets []string) {
 		Msg("📊 Windows synced")
 }
 
+// forEachAsset runs fn for every asset in parallel and waits for all to finish
+// Assets are independent, so a window cycle costs one round-trip instead of one per asset
+func (s *WindowScanner) forEachAsset(assets []string, fn func(asset string)) {
+	var wg sync.WaitGroup
+	sem := make(chan struct{}, maxConcurrentFetches)
+
+	for _, asset := range assets {
+		wg.Add(1)
+		go func(asset string) {
+			defer wg.Done()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+			fn(asset)
+		}(asset)
+	}
+
+	wg.Wait()
+}
+
 // fetchUpDownWindow fetches a specific 15-minute up/down window by slug
 func (s *WindowScanner) fetchUpDownWindow(asset string, startTimestamp int64) {
 	s.fetchUpDownWindowWithPrice(asset, startTimestamp, decimal.Zero)
@@ -331,18 +351,13 @@ func (s *WindowScanner) fetchUpDownWindowWithPrice(asset string, startTimestamp
 	slug := fmt.Sprintf("%s-updown-15m-%d", asset, startTimestamp)
 	url := fmt.Sprintf("%s/events?slug=%s", polymarketAPI, slug)
 
-	resp, err := http.Get(url)
+	resp, err := httpGetWithRetry(url)
 	if err != nil {
 		log.Debug().Err(err).Str("slug", slug).Msg("Failed to fetch window")
 		return
 	}
 	defer resp.Body.Close()
 
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return
-	}
-	
 	var events []struct {
 		ID      string `json:"id"`
 		Title   string `json:"title"`
@@ -360,7 +375,7 @@ func (s *WindowScanner) fetchUpDownWindowWithPrice(asset string, startTimestamp
 		} `json:"markets"`
 	}
 
-	if err := json.Unmarshal(body, &events); err != nil || len(events) == 0 {
+	if err := decodeJSON(resp.Body, &events); err != nil || len(events) == 0 {
 		return
 	}
 
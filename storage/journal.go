@@ -0,0 +1,140 @@
+package storage
+
+import (
+	"compress/gzip"
+	"encoding/json"
+	"fmt"
+	"os"
+	"path/filepath"
+	"sync"
+	"time"
+)
+
+// ═══════════════════════════════════════════════════════════════════════════════
+// TRADE JOURNAL - Append-only gzipped JSONL trade log
+// ═══════════════════════════════════════════════════════════════════════════════
+//
+// One JSON object per line, written as each trade closes:
+//   - No need to hold the full trade history in memory
+//   - Each line is flushed, so a crash loses at most the current record
+//   - Every process run writes its own files; a crashed run's stream has no
+//     gzip trailer, and appending to it would make the rest unreadable
+//
+// Layout (one file per partition per UTC day per run):
+//   <dir>/<partition>/<YYYY-MM-DD>-<run>.jsonl.gz
+//
+// Files are never reopened, so readers can pick exactly the assets/days they
+// need. A crashed run's file reads up to its last record, then ends with an
+// unexpected EOF.
+//
+// ═══════════════════════════════════════════════════════════════════════════════
+
+const journalCompressLevel = 3 // Cheap to write, still ~5x smaller than raw JSON
+
+// Journal appends records to gzipped JSON-lines files partitioned by key and day
+type Journal struct {
+	mu      sync.Mutex
+	dir     string
+	run     string                  // Unique per process run, part of every file name
+	writers map[string]*journalFile // Open file per partition (today's only)
+}
+
+// journalFile is one open day file
+type journalFile struct {
+	day  string
+	file *os.File
+	gz   *gzip.Writer
+	enc  *json.Encoder
+}
+
+// NewJournal creates a journal rooted at dir
+func NewJournal(dir string) (*Journal, error) {
+	if err := os.MkdirAll(dir, 0755); err != nil {
+		return nil, err
+	}
+
+	return &Journal{
+		dir:     dir,
+		run:     fmt.Sprintf("%d-%d", time.Now().UTC().Unix(), os.Getpid()),
+		writers: make(map[string]*journalFile),
+	}, nil
+}
+
+// Append writes a record as a single JSON line to today's file for partition
+func (j *Journal) Append(partition string, record any) error {
+	j.mu.Lock()
+	defer j.mu.Unlock()
+
+	day := time.Now().UTC().Format("2006-01-02")
+
+	w, ok := j.writers[partition]
+	if !ok || w.day != day {
+		// First write for this partition, or the day rolled over
+		if ok {
+			w.close()
+			delete(j.writers, partition)
+		}
+
+		path := filepath.Join(j.dir, partition, day+"-"+j.run+".jsonl.gz")
+		opened, err := openJournalFile(path, day)
+		if err != nil {
+			return err
+		}
+		w = opened
+		j.writers[partition] = w
+	}
+
+	if err := w.enc.Encode(record); err != nil {
+		return err
+	}
+	return w.gz.Flush()
+}
+
+// Close finishes all open gzip streams and closes their files
+func (j *Journal) Close() error {
+	j.mu.Lock()
+	defer j.mu.Unlock()
+
+	var firstErr error
+	for partition, w := range j.writers {
+		if err := w.close(); err != nil && firstErr == nil {
+			firstErr = err
+		}
+		delete(j.writers, partition)
+	}
+	return firstErr
+}
+
+// openJournalFile creates a new day file; an existing one is never appended to
+func openJournalFile(path, day string) (*journalFile, error) {
+	if err := os.MkdirAll(filepath.Dir(path), 0755); err != nil {
+		return nil, err
+	}
+
+	file, err := os.OpenFile(path, os.O_CREATE|os.O_WRONLY|os.O_EXCL, 0644)
+	if err != nil {
+		return nil, err
+	}
+
+	gz, err := gzip.NewWriterLevel(file, journalCompressLevel)
+	if err != nil {
+		file.Close()
+		return nil, err
+	}
+
+	return &journalFile{
+		day:  day,
+		file: file,
+		gz:   gz,
+		enc:  json.NewEncoder(gz),
+	}, nil
+}
+
+// close finishes the gzip stream and closes the file
+func (w *journalFile) close() error {
+	if err := w.gz.Close(); err != nil {
+		w.file.Close()
+		return err
+	}
+	return w.file.Close()
+}
@@ -2,6 +2,7 @@ package strategy
 
 import (
 	"os"
+	"sort"
 	"strconv"
 	"sync"
 	"time"
@@ -79,6 +80,11 @@ type PositionPersister interface {
 	RemovePosition(id string) error
 }
 
+// TradeJournal interface for append-only trade logs (breaks storage → strategy cycle)
+type TradeJournal interface {
+	Append(partition string, record any) error
+}
+
 // PersistablePosition for reconciler
 type PersistablePosition struct {
 	ID       string
@@ -135,6 +141,7 @@ type PhaseScalper struct {
 	// NEW: Professional execution & risk layers (optional, use interfaces)
 	riskGate   TradeApprover     // Risk approval interface
 	persister  PositionPersister // Position persistence interface
+	journal    TradeJournal      // Closed trade log (optional)
 
 	// Config
 	scanIntervalMs int // 50ms scanning
@@ -170,7 +177,7 @@ type PhaseScalper struct {
 	// Paper trading
 	paperMode    bool
 	paperBalance decimal.Decimal
-	paperTrades  []PaperTrade
+	paperTrades  []PaperTrade // Most recent trades only; full history goes to journal
 
 	// Stats
 	totalTrades   int
@@ -242,20 +249,23 @@ type PriceTick struct {
 
 // PaperTrade represents a simulated trade for backtesting/paper mode
 type PaperTrade struct {
-	MarketID   string
-	Asset      string
-	Side       string          // "YES" or "NO"
-	Direction  string          // "BUY" or "SELL"
-	EntryPrice decimal.Decimal
-	ExitPrice  decimal.Decimal
-	Shares     decimal.Decimal
-	PnL        decimal.Decimal
-	EntryTime  time.Time
-	ExitTime   time.Time
-	Reason     string          // "TP", "TIMEOUT", "PHASE_END", etc.
-	Phase      string          // Phase when trade was taken
+	MarketID   string          `json:"market_id"`
+	Asset      string          `json:"asset"`
+	Side       string          `json:"side"`      // "YES" or "NO"
+	Direction  string          `json:"direction"` // "BUY" or "SELL"
+	EntryPrice decimal.Decimal `json:"entry_price"`
+	ExitPrice  decimal.Decimal `json:"exit_price"`
+	Shares     decimal.Decimal `json:"shares"`
+	PnL        decimal.Decimal `json:"pnl"`
+	EntryTime  time.Time       `json:"entry_time"`
+	ExitTime   time.Time       `json:"exit_time"`
+	Reason     string          `json:"reason"` // "TP", "TIMEOUT", "PHASE_END", etc.
+	Phase      string          `json:"phase"`  // Phase when trade was taken
 }
 
+// maxRecentPaperTrades bounds the in-memory trade list (enough for /trades and stats)
+const maxRecentPaperTrades = 100
+
 // NewPhaseScalper creates the phase-based fade scalper
 func NewPhaseScalper(polyFeed *feeds.PolymarketFeed, scanner *feeds.WindowScanner, paperMode bool) *PhaseScalper {
 	// Load order sizes from env (CRITICAL FOR LIVE TRADING)
@@ -395,6 +405,14 @@ func (s *PhaseScalper) SetPersister(p PositionPersister) {
 	log.Info().Msg("📦 Persister attached to Phase Scalper")
 }
 
+// SetJournal attaches a trade journal for closed trades
+func (s *PhaseScalper) SetJournal(j TradeJournal) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+	s.journal = j
+	log.Info().Msg("📓 Trade journal attached to Phase Scalper")
+}
+
 // SetBalance updates the balance (used for LIVE mode to sync with exchange)
 func (s *PhaseScalper) SetBalance(balance decimal.Decimal) {
 	s.mu.Lock()
@@ -732,24 +750,27 @@ func (s *PhaseScalper) detectSharpMove(asset string, side string, lookback time.
 		return nil // Need at least 2 ticks to measure a move
 	}
 
+	// IMPULSE QUALITY FILTER: Require at least 2 consecutive moves in same direction
+	// This filters out single-tick noise - USING SIDE-SPECIFIC COUNTER
+	// Checked first: it is O(1) and rejects most scans before touching history
+	if consecutiveMoves < 2 {
+		return nil // Not enough impulse quality
+	}
+
 	now := time.Now()
 	cutoff := now.Add(-lookback)
 
 	// Find oldest price within lookback window
-	var oldestInWindow *PriceTick
-	var oldestIdx int
-	for i := 0; i < len(history); i++ {
-		if history[i].Timestamp.After(cutoff) {
-			oldestInWindow = &history[i]
-			oldestIdx = i
-			break
-		}
-	}
+	// History is appended in time order, so binary search instead of scanning up to 600 ticks
+	oldestIdx := sort.Search(len(history), func(i int) bool {
+		return history[i].Timestamp.After(cutoff)
+	})
 
 	// If no ticks within lookback, no recent data
-	if oldestInWindow == nil {
+	if oldestIdx == len(history) {
 		return nil
 	}
+	oldestInWindow := &history[oldestIdx]
 
 	// Get current price (last in history)
 	current := history[len(history)-1]
@@ -765,12 +786,6 @@ func (s *PhaseScalper) detectSharpMove(asset string, side string, lookback time.
 	
 	duration := current.Timestamp.Sub(oldestInWindow.Timestamp)
 
-	// IMPULSE QUALITY FILTER: Require at least 2 consecutive moves in same direction
-	// This filters out single-tick noise - USING SIDE-SPECIFIC COUNTER
-	if consecutiveMoves < 2 {
-		return nil // Not enough impulse quality
-	}
-
 	// Debug: log tick details when there's movement
 	if magnitude.GreaterThan(decimal.Zero) {
 		log.Debug().
@@ -1225,7 +1240,7 @@ func (s *PhaseScalper) exitPosition(pos *FadePosition, exitPrice decimal.Decimal
 
 	// Record paper trade
 	if pos.IsPaper {
-		s.paperTrades = append(s.paperTrades, PaperTrade{
+		trade := PaperTrade{
 			MarketID:   pos.MarketID,
 			Asset:      pos.Asset,
 			Side:       pos.Side,
@@ -1235,8 +1250,19 @@ func (s *PhaseScalper) exitPosition(pos *FadePosition, exitPrice decimal.Decimal
 			ExitTime:   time.Now(),
 			PnL:        pnl,
 			Reason:     reason,
-		})
+		}
+
+		s.paperTrades = append(s.paperTrades, trade)
+		if len(s.paperTrades) > maxRecentPaperTrades {
+			s.paperTrades = s.paperTrades[len(s.paperTrades)-maxRecentPaperTrades:]
+		}
 		s.paperBalance = s.paperBalance.Add(pnl)
+
+		if s.journal != nil {
+			if err := s.journal.Append(pos.Asset, trade); err != nil {
+				log.Warn().Err(err).Str("asset", pos.Asset).Msg("⚠️ Failed to journal trade")
+			}
+		}
 	}
 
 	holdTime := time.Since(pos.EntryTime)